@@ -0,0 +1,452 @@
+"""License metadata definitions, imported on first use by :mod:`licenseme_cli.cli`."""
+from __future__ import annotations
+
+import sys
+from itertools import chain
+from types import MappingProxyType
+from typing import Mapping, Sequence
+
+from .cli import (
+    PLACEHOLDER_DESCRIPTION,
+    PLACEHOLDER_EMAIL,
+    PLACEHOLDER_HOLDER,
+    PLACEHOLDER_OWNER,
+    PLACEHOLDER_PROGRAM,
+    PLACEHOLDER_PROJECT,
+    PLACEHOLDER_URL,
+    PLACEHOLDER_YEAR,
+    FieldSpec,
+    LicenseSpec,
+    ReplacementSpec,
+    build_program_tagline,
+    default_email,
+    default_holder,
+    default_project_name,
+    default_year,
+    gpl2_notice_line,
+    holder_with_email,
+    lgpl21_notice_block,
+    normalize_license_key,
+    owner_with_email,
+)
+
+# Field definitions shared across licenses (one per distinct prompt wording).
+_YEAR = FieldSpec("year", "Copyright year", default_factory=default_year, placeholder=PLACEHOLDER_YEAR)
+_COPYRIGHT_HOLDER = FieldSpec(
+    "copyright_holder",
+    "Copyright holder",
+    default_factory=default_holder,
+    placeholder=PLACEHOLDER_HOLDER,
+)
+_AUTHOR_OR_HOLDER = FieldSpec(
+    "copyright_holder",
+    "Author or holder",
+    default_factory=default_holder,
+    placeholder=PLACEHOLDER_HOLDER,
+)
+_AUTHOR = FieldSpec(
+    "copyright_holder",
+    "Author",
+    default_factory=default_holder,
+    placeholder=PLACEHOLDER_HOLDER,
+)
+_OWNER = FieldSpec(
+    "owner",
+    "Copyright holder",
+    default_factory=default_holder,
+    placeholder=PLACEHOLDER_OWNER,
+)
+_EMAIL = FieldSpec(
+    "email",
+    "Contact email (optional)",
+    default_factory=default_email,
+    optional=True,
+    placeholder=PLACEHOLDER_EMAIL,
+)
+_PROGRAM_NAME = FieldSpec(
+    "program_name",
+    "Program name",
+    default_factory=default_project_name,
+    placeholder=PLACEHOLDER_PROGRAM,
+)
+_LIBRARY_NAME = FieldSpec(
+    "program_name",
+    "Library or program name",
+    default_factory=default_project_name,
+    placeholder=PLACEHOLDER_PROGRAM,
+)
+_PROGRAM_OR_LIBRARY_NAME = FieldSpec(
+    "program_name",
+    "Program or library name",
+    default_factory=default_project_name,
+    placeholder=PLACEHOLDER_PROGRAM,
+)
+_PROGRAM_DESCRIPTION = FieldSpec(
+    "program_description",
+    "Program description",
+    optional=True,
+    placeholder=PLACEHOLDER_DESCRIPTION,
+)
+_PROGRAM_URL = FieldSpec(
+    "program_url",
+    "Project URL (optional)",
+    optional=True,
+    placeholder=PLACEHOLDER_URL,
+)
+_PROJECT_NAME = FieldSpec(
+    "project_name",
+    "Project name",
+    default_factory=default_project_name,
+    placeholder=PLACEHOLDER_PROJECT,
+)
+
+LICENSE_SPECS: Sequence[LicenseSpec] = (
+    LicenseSpec(
+        key="MIT",
+        name="MIT License",
+        filename="MIT.txt",
+        aliases=("mit", "mitlicense"),
+        fields=(
+            _YEAR,
+            _COPYRIGHT_HOLDER,
+            _EMAIL,
+        ),
+        replacements=(
+            ReplacementSpec(("<year>",), "year"),
+            ReplacementSpec(("<copyright holders>",), holder_with_email),
+        ),
+    ),
+    LicenseSpec(
+        key="AGPL-3.0-only",
+        name="GNU AGPL v3 (only)",
+        filename="AGPL-3.0-only.txt",
+        aliases=("agpl-3.0-only", "agpl3-only"),
+        fields=(
+            _YEAR,
+            _COPYRIGHT_HOLDER,
+            _EMAIL,
+            _PROGRAM_NAME,
+            _PROGRAM_DESCRIPTION,
+            _PROGRAM_URL,
+        ),
+        replacements=(
+            ReplacementSpec(("<year>",), "year"),
+            ReplacementSpec(("<name of author>",), holder_with_email),
+            ReplacementSpec(
+                ("<one line to give the program's name and a brief idea of what it does.>",),
+                build_program_tagline,
+            ),
+        ),
+    ),
+    LicenseSpec(
+        key="LGPL-2.1-or-later",
+        name="GNU LGPL v2.1 (or later)",
+        filename="LGPL-2.1-or-later.txt",
+        aliases=("lgpl-2.1", "lgpl2.1", "lgpl-2.1+", "lgpl21-or-later"),
+        fields=(
+            _YEAR,
+            _COPYRIGHT_HOLDER,
+            _EMAIL,
+            _LIBRARY_NAME,
+            _PROGRAM_DESCRIPTION,
+            _PROGRAM_URL,
+        ),
+        replacements=(
+            ReplacementSpec(
+                (
+                    "     one line to give the library's name and an idea of what it does.\n     Copyright (C) year  name of author",
+                ),
+                lgpl21_notice_block,
+            ),
+        ),
+    ),
+    LicenseSpec(
+        key="LGPL-2.1-only",
+        name="GNU LGPL v2.1 (only)",
+        filename="LGPL-2.1-only.txt",
+        aliases=("lgpl-2.1-only", "lgpl21"),
+        fields=(
+            _YEAR,
+            _COPYRIGHT_HOLDER,
+            _EMAIL,
+            _LIBRARY_NAME,
+            _PROGRAM_DESCRIPTION,
+            _PROGRAM_URL,
+        ),
+        replacements=(
+            ReplacementSpec(
+                (
+                    "     one line to give the library's name and an idea of what it does.\n     Copyright (C) year  name of author",
+                ),
+                lgpl21_notice_block,
+            ),
+        ),
+    ),
+    LicenseSpec(
+        key="GPL-2.0-only",
+        name="GNU GPL v2 (only)",
+        filename="GPL-2.0-only.txt",
+        aliases=("gpl-2.0-only", "gpl2-only"),
+        fields=(
+            _YEAR,
+            _COPYRIGHT_HOLDER,
+            _EMAIL,
+            _PROGRAM_NAME,
+            _PROGRAM_DESCRIPTION,
+            _PROGRAM_URL,
+        ),
+        replacements=(
+            ReplacementSpec(
+                ("     one line to give the program's name and an idea of what it does. Copyright (C) yyyy name of author",),
+                gpl2_notice_line,
+            ),
+        ),
+    ),
+    LicenseSpec(
+        key="GPL-3.0-only",
+        name="GNU GPL v3 (only)",
+        filename="GPL-3.0-only.txt",
+        aliases=("gpl-3.0-only", "gpl3-only"),
+        fields=(
+            _YEAR,
+            _COPYRIGHT_HOLDER,
+            _EMAIL,
+            _PROGRAM_NAME,
+            _PROGRAM_DESCRIPTION,
+            _PROGRAM_URL,
+        ),
+        replacements=(
+            ReplacementSpec(("<year>",), "year"),
+            ReplacementSpec(("<name of author>",), holder_with_email),
+            ReplacementSpec(("<program>",), "program_name"),
+            ReplacementSpec(
+                ("<one line to give the program's name and a brief idea of what it does.>",),
+                build_program_tagline,
+            ),
+        ),
+    ),
+    LicenseSpec(
+        key="CC0-1.0",
+        name="Creative Commons CC0 1.0 Universal",
+        filename="CC0-1.0.txt",
+        aliases=("cc0", "cc0-1.0", "creative-commons-zero"),
+        fields=(
+            _PROJECT_NAME,
+            _YEAR,
+            _AUTHOR_OR_HOLDER,
+        ),
+        preamble_template="{project_name}\nCopyright (c) {year} {copyright_holder}",
+    ),
+    LicenseSpec(
+        key="BSL-1.0",
+        name="Boost Software License 1.0",
+        filename="BSL-1.0.txt",
+        aliases=("bsl", "boost", "boost-1.0"),
+        fields=(
+            _YEAR,
+            _COPYRIGHT_HOLDER,
+        ),
+        preamble_template="Copyright (c) {year} {copyright_holder}",
+    ),
+    LicenseSpec(
+        key="ISC",
+        name="ISC License",
+        filename="ISC.txt",
+        aliases=("isc",),
+        fields=(
+            _YEAR,
+            _COPYRIGHT_HOLDER,
+        ),
+        preamble_template="Copyright (c) {year} {copyright_holder}",
+    ),
+    LicenseSpec(
+        key="Apache-2.0",
+        name="Apache License 2.0",
+        filename="Apache-2.0.txt",
+        aliases=("apache", "apache2", "apache-2", "apache20"),
+        fields=(
+            _YEAR,
+            _COPYRIGHT_HOLDER,
+            _EMAIL,
+        ),
+        replacements=(
+            ReplacementSpec(("[yyyy]",), "year"),
+            ReplacementSpec(("[name of copyright owner]",), holder_with_email),
+        ),
+    ),
+    LicenseSpec(
+        key="BSD-3-Clause",
+        name="BSD 3-Clause License",
+        filename="BSD-3-Clause.txt",
+        aliases=("bsd3", "bsd-3", "bsd-3-clause"),
+        fields=(
+            _YEAR,
+            _OWNER,
+        ),
+        replacements=(
+            ReplacementSpec(("<year>",), "year"),
+            ReplacementSpec(("<owner>",), owner_with_email),
+        ),
+    ),
+    LicenseSpec(
+        key="BSD-2-Clause",
+        name="BSD 2-Clause License",
+        filename="BSD-2-Clause.txt",
+        aliases=("bsd2", "bsd-2", "simplifiedbsd"),
+        fields=(
+            _YEAR,
+            _OWNER,
+        ),
+        replacements=(
+            ReplacementSpec(("<year>",), "year"),
+            ReplacementSpec(("<owner>",), owner_with_email),
+        ),
+    ),
+    LicenseSpec(
+        key="GPL-3.0-or-later",
+        name="GNU GPL v3 (or later)",
+        filename="GPL-3.0-or-later.txt",
+        aliases=("gpl3", "gpl-3", "gplv3", "gpl-3.0"),
+        fields=(
+            _YEAR,
+            _COPYRIGHT_HOLDER,
+            _EMAIL,
+            _PROGRAM_NAME,
+            _PROGRAM_DESCRIPTION,
+            _PROGRAM_URL,
+        ),
+        replacements=(
+            ReplacementSpec(("<year>",), "year"),
+            ReplacementSpec(("<name of author>",), holder_with_email),
+            ReplacementSpec(("<program>",), "program_name"),
+            ReplacementSpec(
+                ("<one line to give the program's name and a brief idea of what it does.>",),
+                build_program_tagline,
+            ),
+        ),
+    ),
+    LicenseSpec(
+        key="GPL-2.0-or-later",
+        name="GNU GPL v2 (or later)",
+        filename="GPL-2.0-or-later.txt",
+        aliases=("gpl2", "gpl-2", "gplv2", "gpl-2.0"),
+        fields=(
+            _YEAR,
+            _COPYRIGHT_HOLDER,
+            _EMAIL,
+            _PROGRAM_NAME,
+            _PROGRAM_DESCRIPTION,
+            _PROGRAM_URL,
+        ),
+        replacements=(
+            ReplacementSpec(
+                ("     one line to give the program's name and an idea of what it does. Copyright (C) yyyy name of author",),
+                gpl2_notice_line,
+            ),
+        ),
+    ),
+    LicenseSpec(
+        key="LGPL-3.0-or-later",
+        name="GNU LGPL v3 (or later)",
+        filename="LGPL-3.0-or-later.txt",
+        aliases=("lgpl3", "lgpl-3", "lgplv3"),
+        fields=(
+            _YEAR,
+            _COPYRIGHT_HOLDER,
+            _EMAIL,
+            _PROGRAM_OR_LIBRARY_NAME,
+            _PROGRAM_DESCRIPTION,
+            _PROGRAM_URL,
+        ),
+        replacements=(
+            ReplacementSpec(("<year>",), "year"),
+            ReplacementSpec(("<name of author>",), holder_with_email),
+            ReplacementSpec(("<program>",), "program_name"),
+            ReplacementSpec(
+                ("<one line to give the program's name and a brief idea of what it does.>",),
+                build_program_tagline,
+            ),
+        ),
+    ),
+    LicenseSpec(
+        key="AGPL-3.0-or-later",
+        name="GNU AGPL v3 (or later)",
+        filename="AGPL-3.0-or-later.txt",
+        aliases=("agpl3", "agpl-3", "agplv3"),
+        fields=(
+            _YEAR,
+            _COPYRIGHT_HOLDER,
+            _EMAIL,
+            _PROGRAM_NAME,
+            _PROGRAM_DESCRIPTION,
+            _PROGRAM_URL,
+        ),
+        replacements=(
+            ReplacementSpec(("<year>",), "year"),
+            ReplacementSpec(("<name of author>",), holder_with_email),
+            ReplacementSpec(
+                ("<one line to give the program's name and a brief idea of what it does.>",),
+                build_program_tagline,
+            ),
+        ),
+    ),
+    LicenseSpec(
+        key="MPL-2.0",
+        name="Mozilla Public License 2.0",
+        filename="MPL-2.0.txt",
+        aliases=("mpl", "mpl2"),
+        fields=(
+            _PROJECT_NAME,
+            _YEAR,
+            _COPYRIGHT_HOLDER,
+        ),
+        preamble_template="{project_name}\nCopyright (c) {year} {copyright_holder}",
+    ),
+    LicenseSpec(
+        key="EPL-2.0",
+        name="Eclipse Public License 2.0",
+        filename="EPL-2.0.txt",
+        aliases=("epl", "epl2"),
+        fields=(
+            _PROJECT_NAME,
+            _YEAR,
+            _COPYRIGHT_HOLDER,
+        ),
+        preamble_template="{project_name}\nCopyright (c) {year} {copyright_holder}",
+    ),
+    LicenseSpec(
+        key="Unlicense",
+        name="The Unlicense",
+        filename="Unlicense.txt",
+        aliases=("unlicense", "public-domain"),
+        fields=(
+            _PROJECT_NAME,
+            _YEAR,
+            _AUTHOR_OR_HOLDER,
+        ),
+        preamble_template="{project_name}\nCopyright (c) {year} {copyright_holder}",
+    ),
+    LicenseSpec(
+        key="WTFPL",
+        name="Do What The F*ck You Want To Public License",
+        filename="WTFPL.txt",
+        aliases=("wtfpl",),
+        fields=(
+            _PROJECT_NAME,
+            _YEAR,
+            _AUTHOR,
+        ),
+        preamble_template="{project_name}\nCopyright (c) {year} {copyright_holder}",
+    ),
+)
+
+# Canonical keys are registered before any alias; on a clash the later entry wins.
+_license_index = dict(
+    (sys.intern(normalize_license_key(name)), spec)
+    for name, spec in chain(
+        ((spec.key, spec) for spec in LICENSE_SPECS),
+        ((alias, spec) for spec in LICENSE_SPECS for alias in spec.aliases),
+    )
+)
+# Read-only so lookups can be cached safely by the resolver.
+LICENSE_MAP: Mapping[str, LicenseSpec] = MappingProxyType(_license_index)
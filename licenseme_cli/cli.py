@@ -2,19 +2,26 @@
 """Interactive SPDX-based license generator."""
 from __future__ import annotations
 
-import argparse
 import datetime as _dt
+import functools
 import os
-import subprocess
+import re
+import string
 import sys
 from dataclasses import dataclass
-from importlib import resources
+from importlib import import_module, resources
 from pathlib import Path
-from typing import Callable, Dict, Optional, Sequence
+from types import ModuleType
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Pattern, Sequence, Tuple, Union
+
+if TYPE_CHECKING:
+    import argparse
 
 Context = Dict[str, str]
 ValueFactory = Callable[[Context], Optional[str]]
 ValueProvider = Callable[[Context], str]
+# Literal template text interleaved with indexes into ``LicenseSpec.replacements``.
+TemplateSegments = Tuple[Union[str, int], ...]
 
 PLACEHOLDER_YEAR = "<year>"
 PLACEHOLDER_HOLDER = "<copyright holder>"
@@ -25,18 +32,39 @@ PLACEHOLDER_PROGRAM = "<program name>"
 PLACEHOLDER_DESCRIPTION = "<description>"
 PLACEHOLDER_URL = "<url>"
 PACKAGE_NAME = __package__ or "licenseme_cli"
-LICENSES_ROOT = resources.files(PACKAGE_NAME) / "data" / "licenses"
+NO_LICENSE_MESSAGE = "No license specified. Use --list to see available options."
+_NAME_ENV_VARS = ("GIT_AUTHOR_NAME", "AUTHOR", "FULLNAME", "NAME", "USER", "USERNAME")
+_EMAIL_ENV_VARS = ("GIT_AUTHOR_EMAIL", "EMAIL", "AUTHOR_EMAIL")
+# ``slots`` is only accepted by dataclass() on Python 3.10+.
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+# Anything str.isalnum() rejects: non-word characters plus the underscore.
+_NON_ALNUM = re.compile(r"[\W_]+")
+
+
+def _resolve_licenses_root() -> resources.abc.Traversable:
+    root = resources.files(PACKAGE_NAME) / "data" / "licenses"
+    if isinstance(root, Path):
+        return root
+    # Prefer a plain filesystem path; zipped installs keep the importlib Traversable.
+    candidate = Path(str(root))
+    return candidate if candidate.is_dir() else root
+
+
+LICENSES_ROOT = _resolve_licenses_root()
 
 
 def normalize_license_key(name: str) -> str:
     """Normalize a license selector to simplify alias matching."""
-    return "".join(ch for ch in name.lower() if ch.isalnum())
+    return _NON_ALNUM.sub("", name.lower())
 
 
 def read_git_config(key: str) -> str:
+    import subprocess
+
     try:
         completed = subprocess.run(
             ["git", "config", "--get", key],
+            stdin=subprocess.DEVNULL,
             check=True,
             capture_output=True,
             text=True,
@@ -46,38 +74,41 @@ def read_git_config(key: str) -> str:
     return completed.stdout.strip()
 
 
-def guess_full_name() -> str:
-    candidates = [
-        os.environ.get(var, "")
-        for var in (
-            "GIT_AUTHOR_NAME",
-            "AUTHOR",
-            "FULLNAME",
-            "NAME",
-            "USER",
-            "USERNAME",
+@functools.lru_cache(maxsize=1)
+def _git_user_config() -> Dict[str, str]:
+    """Read every ``user.*`` git setting with a single git invocation."""
+    import subprocess
+
+    try:
+        completed = subprocess.run(
+            ["git", "config", "--get-regexp", r"^user\."],
+            stdin=subprocess.DEVNULL,
+            check=False,
+            capture_output=True,
+            text=True,
         )
-    ]
-    for value in candidates:
-        if value:
-            return value
-    git_name = read_git_config("user.name")
-    return git_name
+    except FileNotFoundError:
+        return {}
+    config: Dict[str, str] = {}
+    # Later entries win, matching what ``git config --get`` reports.
+    for line in completed.stdout.splitlines():
+        key, _, value = line.partition(" ")
+        config[key] = value.strip()
+    return config
+
+
+def _first_env_value(names: Sequence[str]) -> str:
+    return next((value for value in map(os.environ.get, names) if value), "")
+
+
+@functools.lru_cache(maxsize=1)
+def guess_full_name() -> str:
+    return _first_env_value(_NAME_ENV_VARS) or _git_user_config().get("user.name", "")
 
 
+@functools.lru_cache(maxsize=1)
 def guess_email() -> str:
-    candidates = [
-        os.environ.get(var, "")
-        for var in (
-            "GIT_AUTHOR_EMAIL",
-            "EMAIL",
-            "AUTHOR_EMAIL",
-        )
-    ]
-    for value in candidates:
-        if value:
-            return value
-    return read_git_config("user.email")
+    return _first_env_value(_EMAIL_ENV_VARS) or _git_user_config().get("user.email", "")
 
 
 def default_year(_: Context) -> str:
@@ -100,7 +131,7 @@ def ensure_value(text: Optional[str]) -> str:
     return text.strip() if text else ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
 class FieldSpec:
     key: str
     prompt: str
@@ -109,13 +140,14 @@ class FieldSpec:
     placeholder: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
 class ReplacementSpec:
     tokens: Sequence[str]
     value: ValueProvider | str
 
 
-@dataclass(frozen=True)
+# Specs are compared and hashed by identity: the per-spec caches key on them.
+@dataclass(frozen=True, eq=False, **_DATACLASS_OPTIONS)
 class LicenseSpec:
     key: str
     name: str
@@ -143,17 +175,19 @@ def holder_with_email(
     return holder
 
 
+def owner_with_email(context: Context) -> str:
+    return holder_with_email(context, holder_key="owner")
+
+
 def build_program_tagline(context: Context) -> str:
-    name = ensure_value(context.get("program_name"))
-    description = ensure_value(context.get("program_description"))
-    url = ensure_value(context.get("program_url"))
-    email = ensure_value(context.get("email"))
-    pieces = [segment for segment in (name, description, url) if segment]
+    name = context.get("program_name", "").strip()
+    description = context.get("program_description", "").strip()
+    url = context.get("program_url", "").strip()
+    email = context.get("email", "").strip()
+    tagline = " - ".join(segment for segment in (name, description, url) if segment)
     if email:
-        pieces.append(f"<{email}>")
-    if pieces:
-        return " - ".join(pieces)
-    return "This program"
+        tagline = f"{tagline} - <{email}>" if tagline else f"<{email}>"
+    return tagline or "This program"
 
 
 def ensure_sentence(text: str) -> str:
@@ -174,11 +208,18 @@ def lgpl21_notice_block(context: Context) -> str:
     return f"{header}\n{body}"
 
 
-def load_license_text(spec: LicenseSpec) -> str:
-    resource = spec.template_resource()
+@functools.lru_cache(maxsize=None)
+def _read_template(filename: str) -> str:
+    resource = LICENSES_ROOT / filename
     if not resource.is_file():
-        raise FileNotFoundError(f"Template file not found: {spec.filename}")
-    return resource.read_text(encoding="utf-8")
+        raise FileNotFoundError(f"Template file not found: {filename}")
+    text = resource.read_text(encoding="utf-8")
+    # Rendered licenses always end with a newline; guarantee it once here.
+    return text if text.endswith("\n") else text + "\n"
+
+
+def load_license_text(spec: LicenseSpec) -> str:
+    return _read_template(spec.filename)
 
 
 def evaluate_value(provider: ValueProvider | str, context: Context) -> str:
@@ -189,21 +230,95 @@ def evaluate_value(provider: ValueProvider | str, context: Context) -> str:
     return str(provider)
 
 
-def apply_replacements(text: str, replacements: Sequence[ReplacementSpec], context: Context) -> str:
-    for repl in replacements:
-        value = evaluate_value(repl.value, context)
+@functools.lru_cache(maxsize=None)
+def _token_pattern(tokens: Tuple[str, ...]) -> Pattern[str]:
+    # Longest tokens first so a token never shadows a longer one sharing its prefix.
+    ordered = sorted(tokens, key=len, reverse=True)
+    return re.compile("(" + "|".join(re.escape(token) for token in ordered) + ")")
+
+
+def _token_owners(replacements: Sequence[ReplacementSpec]) -> Dict[str, int]:
+    # The first replacement listing a token owns it, as with sequential str.replace.
+    owners: Dict[str, int] = {}
+    for index, repl in enumerate(replacements):
         for token in repl.tokens:
-            text = text.replace(token, value)
-    return text
+            owners.setdefault(token, index)
+    return owners
 
 
-def append_preamble(text: str, template: str, context: Context) -> str:
+@functools.lru_cache(maxsize=None)
+def _compile_template(spec: LicenseSpec) -> TemplateSegments:
+    """Split a license template into literal text and replacement slots once."""
+    text = load_license_text(spec)
+    owners = _token_owners(spec.replacements)
+    if not owners:
+        return (text,)
+    pieces = _token_pattern(tuple(owners)).split(text)
+    segments = []
+    for position, piece in enumerate(pieces):
+        if position % 2:
+            segments.append(owners[piece])
+        elif piece:
+            segments.append(piece)
+    return tuple(segments)
+
+
+def apply_replacements(text: str, replacements: Sequence[ReplacementSpec], context: Context) -> str:
+    owners = _token_owners(replacements)
+    if not owners:
+        return text
+    values: Dict[int, str] = {}
+
+    def substitute(match: re.Match[str]) -> str:
+        index = owners[match.group(0)]
+        if index not in values:
+            values[index] = evaluate_value(replacements[index].value, context)
+        return values[index]
+
+    return _token_pattern(tuple(owners)).sub(substitute, text)
+
+
+def fill_segments(segments: TemplateSegments, replacements: Sequence[ReplacementSpec], context: Context) -> List[str]:
+    # Only replacements whose tokens occur in the template are ever evaluated.
+    values: Dict[int, str] = {}
+    pieces = []
+    for segment in segments:
+        if not isinstance(segment, str):
+            if segment not in values:
+                values[segment] = evaluate_value(replacements[segment].value, context)
+            segment = values[segment]
+        if segment:
+            pieces.append(segment)
+    return pieces
+
+
+@functools.lru_cache(maxsize=None)
+def _preamble_renderer(template: str) -> ValueProvider:
+    """Compile a preamble once; plain ``{name}`` fields are joined without ``format_map``."""
+    parts = []
+    for literal, field, format_spec, conversion in string.Formatter().parse(template):
+        if field is not None and (format_spec or conversion or not field.isidentifier()):
+            return template.format_map
+        parts.append((literal, field))
+    compiled = tuple(parts)
+
+    def render(context: Context) -> str:
+        return "".join(literal + context[field] if field else literal for literal, field in compiled)
+
+    return render
+
+
+def render_preamble(template: str, context: Context) -> str:
     try:
-        rendered = template.format_map(context)
+        rendered = _preamble_renderer(template)(context)
     except KeyError as exc:
         missing = exc.args[0]
         raise KeyError(f"Missing value '{missing}' required by this template") from exc
-    rendered = rendered.strip()
+    return rendered.strip()
+
+
+def append_preamble(text: str, template: str, context: Context) -> str:
+    rendered = render_preamble(template, context)
     if rendered:
         return f"{rendered}\n\n{text}"
     return text
@@ -216,6 +331,12 @@ def _placeholder_for(field: FieldSpec) -> str:
     return f"<{pretty}>"
 
 
+@functools.lru_cache(maxsize=None)
+def _prompt_plan(spec: LicenseSpec) -> Tuple[Tuple[FieldSpec, str], ...]:
+    """Pair each field with the value used when it has no default."""
+    return tuple((field, "" if field.optional else _placeholder_for(field)) for field in spec.fields)
+
+
 def collect_field_values(
     spec: LicenseSpec,
     skip_prompts: bool,
@@ -224,25 +345,19 @@ def collect_field_values(
     values: Context = {}
     if overrides:
         for key, value in overrides.items():
-            trimmed = ensure_value(value)
+            trimmed = value.strip()
             if trimmed:
                 values[key] = trimmed
-    for field in spec.fields:
-        prefilled = ensure_value(values.get(field.key, ""))
-        if prefilled:
-            values[field.key] = prefilled
+    # Overrides are trimmed once above, so prefilled values need no further cleanup.
+    for field, fallback in _prompt_plan(spec):
+        if values.get(field.key):
             continue
         default = ensure_value(field.default_factory(values) if field.default_factory else "")
-        placeholder = _placeholder_for(field)
+        prompt_default = default or fallback
         if skip_prompts:
-            candidate = default or ("" if field.optional else placeholder)
-            values[field.key] = candidate
+            values[field.key] = prompt_default
             continue
-        prompt = field.prompt
-        prompt_default = default or ("" if field.optional else placeholder)
-        if prompt_default:
-            prompt = f"{prompt} [{prompt_default}]"
-        prompt += ": "
+        prompt = f"{field.prompt} [{prompt_default}]: " if prompt_default else f"{field.prompt}: "
         while True:
             try:
                 user_input = input(prompt)
@@ -260,728 +375,86 @@ def collect_field_values(
     return values
 
 
-def render_license(spec: LicenseSpec, context: Context) -> str:
-    text = load_license_text(spec)
-    if spec.replacements:
-        text = apply_replacements(text, spec.replacements, context)
+def render_license_segments(spec: LicenseSpec, context: Context) -> List[str]:
+    """Render a license as a list of text pieces, ready for ``writelines``."""
+    pieces = fill_segments(_compile_template(spec), spec.replacements, context)
     if spec.preamble_template:
-        text = append_preamble(text, spec.preamble_template, context)
-    if not text.endswith("\n"):
-        text += "\n"
-    return text
+        preamble = render_preamble(spec.preamble_template, context)
+        if preamble:
+            pieces[:0] = (preamble, "\n\n")
+    return pieces
 
 
-def display_license_list(specs: Sequence[LicenseSpec]) -> None:
+def render_license(spec: LicenseSpec, context: Context) -> str:
+    return "".join(render_license_segments(spec, context))
+
+
+@functools.lru_cache(maxsize=None)
+def _license_listing(specs: Tuple[LicenseSpec, ...]) -> str:
     width = max(len(spec.key) for spec in specs)
+    lines = []
     for spec in specs:
         aliases = ", ".join(sorted(set(spec.aliases) - {spec.key}))
         alias_text = f" (aliases: {aliases})" if aliases else ""
-        print(f"{spec.key.ljust(width)} - {spec.name}{alias_text}")
-
-
-# License metadata definitions.
-LICENSE_SPECS: Sequence[LicenseSpec] = (
-    LicenseSpec(
-        key="MIT",
-        name="MIT License",
-        filename="MIT.txt",
-        aliases=("mit", "mitlicense"),
-        fields=(
-            FieldSpec("year", "Copyright year", default_factory=default_year, placeholder=PLACEHOLDER_YEAR),
-            FieldSpec(
-                "copyright_holder",
-                "Copyright holder",
-                default_factory=default_holder,
-                placeholder=PLACEHOLDER_HOLDER,
-            ),
-            FieldSpec(
-                "email",
-                "Contact email (optional)",
-                default_factory=default_email,
-                optional=True,
-                placeholder=PLACEHOLDER_EMAIL,
-            ),
-        ),
-        replacements=(
-            ReplacementSpec(("<year>",), "year"),
-            ReplacementSpec(("<copyright holders>",), lambda ctx: holder_with_email(ctx)),
-        ),
-    ),
-    LicenseSpec(
-        key="AGPL-3.0-only",
-        name="GNU AGPL v3 (only)",
-        filename="AGPL-3.0-only.txt",
-        aliases=("agpl-3.0-only", "agpl3-only"),
-        fields=(
-            FieldSpec("year", "Copyright year", default_factory=default_year, placeholder=PLACEHOLDER_YEAR),
-            FieldSpec(
-                "copyright_holder",
-                "Copyright holder",
-                default_factory=default_holder,
-                placeholder=PLACEHOLDER_HOLDER,
-            ),
-            FieldSpec(
-                "email",
-                "Contact email (optional)",
-                default_factory=default_email,
-                optional=True,
-                placeholder=PLACEHOLDER_EMAIL,
-            ),
-            FieldSpec(
-                "program_name",
-                "Program name",
-                default_factory=default_project_name,
-                placeholder=PLACEHOLDER_PROGRAM,
-            ),
-            FieldSpec(
-                "program_description",
-                "Program description",
-                optional=True,
-                placeholder=PLACEHOLDER_DESCRIPTION,
-            ),
-            FieldSpec(
-                "program_url",
-                "Project URL (optional)",
-                optional=True,
-                placeholder=PLACEHOLDER_URL,
-            ),
-        ),
-        replacements=(
-            ReplacementSpec(("<year>",), "year"),
-            ReplacementSpec(("<name of author>",), lambda ctx: holder_with_email(ctx)),
-            ReplacementSpec(
-                ("<one line to give the program's name and a brief idea of what it does.>",),
-                lambda ctx: build_program_tagline(ctx),
-            ),
-        ),
-    ),
-    LicenseSpec(
-        key="LGPL-2.1-or-later",
-        name="GNU LGPL v2.1 (or later)",
-        filename="LGPL-2.1-or-later.txt",
-        aliases=("lgpl-2.1", "lgpl2.1", "lgpl-2.1+", "lgpl21-or-later"),
-        fields=(
-            FieldSpec("year", "Copyright year", default_factory=default_year, placeholder=PLACEHOLDER_YEAR),
-            FieldSpec(
-                "copyright_holder",
-                "Copyright holder",
-                default_factory=default_holder,
-                placeholder=PLACEHOLDER_HOLDER,
-            ),
-            FieldSpec(
-                "email",
-                "Contact email (optional)",
-                default_factory=default_email,
-                optional=True,
-                placeholder=PLACEHOLDER_EMAIL,
-            ),
-            FieldSpec(
-                "program_name",
-                "Library or program name",
-                default_factory=default_project_name,
-                placeholder=PLACEHOLDER_PROGRAM,
-            ),
-            FieldSpec(
-                "program_description",
-                "Program description",
-                optional=True,
-                placeholder=PLACEHOLDER_DESCRIPTION,
-            ),
-            FieldSpec(
-                "program_url",
-                "Project URL (optional)",
-                optional=True,
-                placeholder=PLACEHOLDER_URL,
-            ),
-        ),
-        replacements=(
-            ReplacementSpec(
-                (
-                    "     one line to give the library's name and an idea of what it does.\n     Copyright (C) year  name of author",
-                ),
-                lgpl21_notice_block,
-            ),
-        ),
-    ),
-    LicenseSpec(
-        key="LGPL-2.1-only",
-        name="GNU LGPL v2.1 (only)",
-        filename="LGPL-2.1-only.txt",
-        aliases=("lgpl-2.1-only", "lgpl21"),
-        fields=(
-            FieldSpec("year", "Copyright year", default_factory=default_year, placeholder=PLACEHOLDER_YEAR),
-            FieldSpec(
-                "copyright_holder",
-                "Copyright holder",
-                default_factory=default_holder,
-                placeholder=PLACEHOLDER_HOLDER,
-            ),
-            FieldSpec(
-                "email",
-                "Contact email (optional)",
-                default_factory=default_email,
-                optional=True,
-                placeholder=PLACEHOLDER_EMAIL,
-            ),
-            FieldSpec(
-                "program_name",
-                "Library or program name",
-                default_factory=default_project_name,
-                placeholder=PLACEHOLDER_PROGRAM,
-            ),
-            FieldSpec(
-                "program_description",
-                "Program description",
-                optional=True,
-                placeholder=PLACEHOLDER_DESCRIPTION,
-            ),
-            FieldSpec(
-                "program_url",
-                "Project URL (optional)",
-                optional=True,
-                placeholder=PLACEHOLDER_URL,
-            ),
-        ),
-        replacements=(
-            ReplacementSpec(
-                (
-                    "     one line to give the library's name and an idea of what it does.\n     Copyright (C) year  name of author",
-                ),
-                lgpl21_notice_block,
-            ),
-        ),
-    ),
-    LicenseSpec(
-        key="GPL-2.0-only",
-        name="GNU GPL v2 (only)",
-        filename="GPL-2.0-only.txt",
-        aliases=("gpl-2.0-only", "gpl2-only"),
-        fields=(
-            FieldSpec("year", "Copyright year", default_factory=default_year, placeholder=PLACEHOLDER_YEAR),
-            FieldSpec(
-                "copyright_holder",
-                "Copyright holder",
-                default_factory=default_holder,
-                placeholder=PLACEHOLDER_HOLDER,
-            ),
-            FieldSpec(
-                "email",
-                "Contact email (optional)",
-                default_factory=default_email,
-                optional=True,
-                placeholder=PLACEHOLDER_EMAIL,
-            ),
-            FieldSpec(
-                "program_name",
-                "Program name",
-                default_factory=default_project_name,
-                placeholder=PLACEHOLDER_PROGRAM,
-            ),
-            FieldSpec(
-                "program_description",
-                "Program description",
-                optional=True,
-                placeholder=PLACEHOLDER_DESCRIPTION,
-            ),
-            FieldSpec(
-                "program_url",
-                "Project URL (optional)",
-                optional=True,
-                placeholder=PLACEHOLDER_URL,
-            ),
-        ),
-        replacements=(
-            ReplacementSpec(
-                ("     one line to give the program's name and an idea of what it does. Copyright (C) yyyy name of author",),
-                gpl2_notice_line,
-            ),
-        ),
-    ),
-    LicenseSpec(
-        key="GPL-3.0-only",
-        name="GNU GPL v3 (only)",
-        filename="GPL-3.0-only.txt",
-        aliases=("gpl-3.0-only", "gpl3-only"),
-        fields=(
-            FieldSpec("year", "Copyright year", default_factory=default_year, placeholder=PLACEHOLDER_YEAR),
-            FieldSpec(
-                "copyright_holder",
-                "Copyright holder",
-                default_factory=default_holder,
-                placeholder=PLACEHOLDER_HOLDER,
-            ),
-            FieldSpec(
-                "email",
-                "Contact email (optional)",
-                default_factory=default_email,
-                optional=True,
-                placeholder=PLACEHOLDER_EMAIL,
-            ),
-            FieldSpec(
-                "program_name",
-                "Program name",
-                default_factory=default_project_name,
-                placeholder=PLACEHOLDER_PROGRAM,
-            ),
-            FieldSpec(
-                "program_description",
-                "Program description",
-                optional=True,
-                placeholder=PLACEHOLDER_DESCRIPTION,
-            ),
-            FieldSpec(
-                "program_url",
-                "Project URL (optional)",
-                optional=True,
-                placeholder=PLACEHOLDER_URL,
-            ),
-        ),
-        replacements=(
-            ReplacementSpec(("<year>",), "year"),
-            ReplacementSpec(("<name of author>",), lambda ctx: holder_with_email(ctx)),
-            ReplacementSpec(("<program>",), "program_name"),
-            ReplacementSpec(
-                ("<one line to give the program's name and a brief idea of what it does.>",),
-                lambda ctx: build_program_tagline(ctx),
-            ),
-        ),
-    ),
-    LicenseSpec(
-        key="CC0-1.0",
-        name="Creative Commons CC0 1.0 Universal",
-        filename="CC0-1.0.txt",
-        aliases=("cc0", "cc0-1.0", "creative-commons-zero"),
-        fields=(
-            FieldSpec(
-                "project_name",
-                "Project name",
-                default_factory=default_project_name,
-                placeholder=PLACEHOLDER_PROJECT,
-            ),
-            FieldSpec("year", "Copyright year", default_factory=default_year, placeholder=PLACEHOLDER_YEAR),
-            FieldSpec(
-                "copyright_holder",
-                "Author or holder",
-                default_factory=default_holder,
-                placeholder=PLACEHOLDER_HOLDER,
-            ),
-        ),
-        preamble_template="{project_name}\nCopyright (c) {year} {copyright_holder}",
-    ),
-    LicenseSpec(
-        key="BSL-1.0",
-        name="Boost Software License 1.0",
-        filename="BSL-1.0.txt",
-        aliases=("bsl", "boost", "boost-1.0"),
-        fields=(
-            FieldSpec("year", "Copyright year", default_factory=default_year, placeholder=PLACEHOLDER_YEAR),
-            FieldSpec(
-                "copyright_holder",
-                "Copyright holder",
-                default_factory=default_holder,
-                placeholder=PLACEHOLDER_HOLDER,
-            ),
-        ),
-        preamble_template="Copyright (c) {year} {copyright_holder}",
-    ),
-    LicenseSpec(
-        key="ISC",
-        name="ISC License",
-        filename="ISC.txt",
-        aliases=("isc",),
-        fields=(
-            FieldSpec("year", "Copyright year", default_factory=default_year, placeholder=PLACEHOLDER_YEAR),
-            FieldSpec(
-                "copyright_holder",
-                "Copyright holder",
-                default_factory=default_holder,
-                placeholder=PLACEHOLDER_HOLDER,
-            ),
-        ),
-        preamble_template="Copyright (c) {year} {copyright_holder}",
-    ),
-    LicenseSpec(
-        key="Apache-2.0",
-        name="Apache License 2.0",
-        filename="Apache-2.0.txt",
-        aliases=("apache", "apache2", "apache-2", "apache20"),
-        fields=(
-            FieldSpec("year", "Copyright year", default_factory=default_year, placeholder=PLACEHOLDER_YEAR),
-            FieldSpec(
-                "copyright_holder",
-                "Copyright holder",
-                default_factory=default_holder,
-                placeholder=PLACEHOLDER_HOLDER,
-            ),
-            FieldSpec(
-                "email",
-                "Contact email (optional)",
-                default_factory=default_email,
-                optional=True,
-                placeholder=PLACEHOLDER_EMAIL,
-            ),
-        ),
-        replacements=(
-            ReplacementSpec(("[yyyy]",), "year"),
-            ReplacementSpec(("[name of copyright owner]",), lambda ctx: holder_with_email(ctx)),
-        ),
-    ),
-    LicenseSpec(
-        key="BSD-3-Clause",
-        name="BSD 3-Clause License",
-        filename="BSD-3-Clause.txt",
-        aliases=("bsd3", "bsd-3", "bsd-3-clause"),
-        fields=(
-            FieldSpec("year", "Copyright year", default_factory=default_year, placeholder=PLACEHOLDER_YEAR),
-            FieldSpec(
-                "owner",
-                "Copyright holder",
-                default_factory=default_holder,
-                placeholder=PLACEHOLDER_OWNER,
-            ),
-        ),
-        replacements=(
-            ReplacementSpec(("<year>",), "year"),
-            ReplacementSpec(("<owner>",), lambda ctx: holder_with_email(ctx, holder_key="owner")),
-        ),
-    ),
-    LicenseSpec(
-        key="BSD-2-Clause",
-        name="BSD 2-Clause License",
-        filename="BSD-2-Clause.txt",
-        aliases=("bsd2", "bsd-2", "simplifiedbsd"),
-        fields=(
-            FieldSpec("year", "Copyright year", default_factory=default_year, placeholder=PLACEHOLDER_YEAR),
-            FieldSpec(
-                "owner",
-                "Copyright holder",
-                default_factory=default_holder,
-                placeholder=PLACEHOLDER_OWNER,
-            ),
-        ),
-        replacements=(
-            ReplacementSpec(("<year>",), "year"),
-            ReplacementSpec(("<owner>",), lambda ctx: holder_with_email(ctx, holder_key="owner")),
-        ),
-    ),
-    LicenseSpec(
-        key="GPL-3.0-or-later",
-        name="GNU GPL v3 (or later)",
-        filename="GPL-3.0-or-later.txt",
-        aliases=("gpl3", "gpl-3", "gplv3", "gpl-3.0"),
-        fields=(
-            FieldSpec("year", "Copyright year", default_factory=default_year, placeholder=PLACEHOLDER_YEAR),
-            FieldSpec(
-                "copyright_holder",
-                "Copyright holder",
-                default_factory=default_holder,
-                placeholder=PLACEHOLDER_HOLDER,
-            ),
-            FieldSpec(
-                "email",
-                "Contact email (optional)",
-                default_factory=default_email,
-                optional=True,
-                placeholder=PLACEHOLDER_EMAIL,
-            ),
-            FieldSpec(
-                "program_name",
-                "Program name",
-                default_factory=default_project_name,
-                placeholder=PLACEHOLDER_PROGRAM,
-            ),
-            FieldSpec(
-                "program_description",
-                "Program description",
-                optional=True,
-                placeholder=PLACEHOLDER_DESCRIPTION,
-            ),
-            FieldSpec(
-                "program_url",
-                "Project URL (optional)",
-                optional=True,
-                placeholder=PLACEHOLDER_URL,
-            ),
-        ),
-        replacements=(
-            ReplacementSpec(("<year>",), "year"),
-            ReplacementSpec(("<name of author>",), lambda ctx: holder_with_email(ctx)),
-            ReplacementSpec(("<program>",), "program_name"),
-            ReplacementSpec(
-                ("<one line to give the program's name and a brief idea of what it does.>",),
-                lambda ctx: build_program_tagline(ctx),
-            ),
-        ),
-    ),
-    LicenseSpec(
-        key="GPL-2.0-or-later",
-        name="GNU GPL v2 (or later)",
-        filename="GPL-2.0-or-later.txt",
-        aliases=("gpl2", "gpl-2", "gplv2", "gpl-2.0"),
-        fields=(
-            FieldSpec("year", "Copyright year", default_factory=default_year, placeholder=PLACEHOLDER_YEAR),
-            FieldSpec(
-                "copyright_holder",
-                "Copyright holder",
-                default_factory=default_holder,
-                placeholder=PLACEHOLDER_HOLDER,
-            ),
-            FieldSpec(
-                "email",
-                "Contact email (optional)",
-                default_factory=default_email,
-                optional=True,
-                placeholder=PLACEHOLDER_EMAIL,
-            ),
-            FieldSpec(
-                "program_name",
-                "Program name",
-                default_factory=default_project_name,
-                placeholder=PLACEHOLDER_PROGRAM,
-            ),
-            FieldSpec(
-                "program_description",
-                "Program description",
-                optional=True,
-                placeholder=PLACEHOLDER_DESCRIPTION,
-            ),
-            FieldSpec(
-                "program_url",
-                "Project URL (optional)",
-                optional=True,
-                placeholder=PLACEHOLDER_URL,
-            ),
-        ),
-        replacements=(
-            ReplacementSpec(
-                ("     one line to give the program's name and an idea of what it does. Copyright (C) yyyy name of author",),
-                gpl2_notice_line,
-            ),
-        ),
-    ),
-    LicenseSpec(
-        key="LGPL-3.0-or-later",
-        name="GNU LGPL v3 (or later)",
-        filename="LGPL-3.0-or-later.txt",
-        aliases=("lgpl3", "lgpl-3", "lgplv3"),
-        fields=(
-            FieldSpec("year", "Copyright year", default_factory=default_year, placeholder=PLACEHOLDER_YEAR),
-            FieldSpec(
-                "copyright_holder",
-                "Copyright holder",
-                default_factory=default_holder,
-                placeholder=PLACEHOLDER_HOLDER,
-            ),
-            FieldSpec(
-                "email",
-                "Contact email (optional)",
-                default_factory=default_email,
-                optional=True,
-                placeholder=PLACEHOLDER_EMAIL,
-            ),
-            FieldSpec(
-                "program_name",
-                "Program or library name",
-                default_factory=default_project_name,
-                placeholder=PLACEHOLDER_PROGRAM,
-            ),
-            FieldSpec(
-                "program_description",
-                "Program description",
-                optional=True,
-                placeholder=PLACEHOLDER_DESCRIPTION,
-            ),
-            FieldSpec(
-                "program_url",
-                "Project URL (optional)",
-                optional=True,
-                placeholder=PLACEHOLDER_URL,
-            ),
-        ),
-        replacements=(
-            ReplacementSpec(("<year>",), "year"),
-            ReplacementSpec(("<name of author>",), lambda ctx: holder_with_email(ctx)),
-            ReplacementSpec(("<program>",), "program_name"),
-            ReplacementSpec(
-                ("<one line to give the program's name and a brief idea of what it does.>",),
-                lambda ctx: build_program_tagline(ctx),
-            ),
-        ),
-    ),
-    LicenseSpec(
-        key="AGPL-3.0-or-later",
-        name="GNU AGPL v3 (or later)",
-        filename="AGPL-3.0-or-later.txt",
-        aliases=("agpl3", "agpl-3", "agplv3"),
-        fields=(
-            FieldSpec("year", "Copyright year", default_factory=default_year, placeholder=PLACEHOLDER_YEAR),
-            FieldSpec(
-                "copyright_holder",
-                "Copyright holder",
-                default_factory=default_holder,
-                placeholder=PLACEHOLDER_HOLDER,
-            ),
-            FieldSpec(
-                "email",
-                "Contact email (optional)",
-                default_factory=default_email,
-                optional=True,
-                placeholder=PLACEHOLDER_EMAIL,
-            ),
-            FieldSpec(
-                "program_name",
-                "Program name",
-                default_factory=default_project_name,
-                placeholder=PLACEHOLDER_PROGRAM,
-            ),
-            FieldSpec(
-                "program_description",
-                "Program description",
-                optional=True,
-                placeholder=PLACEHOLDER_DESCRIPTION,
-            ),
-            FieldSpec(
-                "program_url",
-                "Project URL (optional)",
-                optional=True,
-                placeholder=PLACEHOLDER_URL,
-            ),
-        ),
-        replacements=(
-            ReplacementSpec(("<year>",), "year"),
-            ReplacementSpec(("<name of author>",), lambda ctx: holder_with_email(ctx)),
-            ReplacementSpec(
-                ("<one line to give the program's name and a brief idea of what it does.>",),
-                lambda ctx: build_program_tagline(ctx),
-            ),
-        ),
-    ),
-    LicenseSpec(
-        key="MPL-2.0",
-        name="Mozilla Public License 2.0",
-        filename="MPL-2.0.txt",
-        aliases=("mpl", "mpl2"),
-        fields=(
-            FieldSpec(
-                "project_name",
-                "Project name",
-                default_factory=default_project_name,
-                placeholder=PLACEHOLDER_PROJECT,
-            ),
-            FieldSpec("year", "Copyright year", default_factory=default_year, placeholder=PLACEHOLDER_YEAR),
-            FieldSpec(
-                "copyright_holder",
-                "Copyright holder",
-                default_factory=default_holder,
-                placeholder=PLACEHOLDER_HOLDER,
-            ),
-        ),
-        preamble_template="{project_name}\nCopyright (c) {year} {copyright_holder}",
-    ),
-    LicenseSpec(
-        key="EPL-2.0",
-        name="Eclipse Public License 2.0",
-        filename="EPL-2.0.txt",
-        aliases=("epl", "epl2"),
-        fields=(
-            FieldSpec(
-                "project_name",
-                "Project name",
-                default_factory=default_project_name,
-                placeholder=PLACEHOLDER_PROJECT,
-            ),
-            FieldSpec("year", "Copyright year", default_factory=default_year, placeholder=PLACEHOLDER_YEAR),
-            FieldSpec(
-                "copyright_holder",
-                "Copyright holder",
-                default_factory=default_holder,
-                placeholder=PLACEHOLDER_HOLDER,
-            ),
-        ),
-        preamble_template="{project_name}\nCopyright (c) {year} {copyright_holder}",
-    ),
-    LicenseSpec(
-        key="Unlicense",
-        name="The Unlicense",
-        filename="Unlicense.txt",
-        aliases=("unlicense", "public-domain"),
-        fields=(
-            FieldSpec(
-                "project_name",
-                "Project name",
-                default_factory=default_project_name,
-                placeholder=PLACEHOLDER_PROJECT,
-            ),
-            FieldSpec("year", "Copyright year", default_factory=default_year, placeholder=PLACEHOLDER_YEAR),
-            FieldSpec(
-                "copyright_holder",
-                "Author or holder",
-                default_factory=default_holder,
-                placeholder=PLACEHOLDER_HOLDER,
-            ),
-        ),
-        preamble_template="{project_name}\nCopyright (c) {year} {copyright_holder}",
-    ),
-    LicenseSpec(
-        key="WTFPL",
-        name="Do What The F*ck You Want To Public License",
-        filename="WTFPL.txt",
-        aliases=("wtfpl",),
-        fields=(
-            FieldSpec(
-                "project_name",
-                "Project name",
-                default_factory=default_project_name,
-                placeholder=PLACEHOLDER_PROJECT,
-            ),
-            FieldSpec("year", "Copyright year", default_factory=default_year, placeholder=PLACEHOLDER_YEAR),
-            FieldSpec(
-                "copyright_holder",
-                "Author",
-                default_factory=default_holder,
-                placeholder=PLACEHOLDER_HOLDER,
-            ),
-        ),
-        preamble_template="{project_name}\nCopyright (c) {year} {copyright_holder}",
-    ),
-)
+        lines.append(f"{spec.key.ljust(width)} - {spec.name}{alias_text}")
+    return "\n".join(lines)
+
+
+def display_license_list(specs: Sequence[LicenseSpec]) -> None:
+    print(_license_listing(tuple(specs)))
 
-LICENSE_MAP = {normalize_license_key(spec.key): spec for spec in LICENSE_SPECS}
-for spec in LICENSE_SPECS:
-    for alias in spec.aliases:
-        LICENSE_MAP[normalize_license_key(alias)] = spec
+
+def _spec_table() -> ModuleType:
+    # Imported by absolute name so running this file directly still finds the table.
+    return import_module(f"{PACKAGE_NAME}._specs")
+
+
+def __getattr__(name: str) -> object:
+    # LICENSE_SPECS and LICENSE_MAP are only built when something asks for them.
+    if name in ("LICENSE_SPECS", "LICENSE_MAP"):
+        value = getattr(_spec_table(), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@functools.lru_cache(maxsize=64)
+def _resolve_or_none(name: str) -> Optional[LicenseSpec]:
+    return _spec_table().LICENSE_MAP.get(normalize_license_key(name))
 
 
 def resolve_spec(name: str) -> LicenseSpec:
-    key = normalize_license_key(name)
-    spec = LICENSE_MAP.get(key)
+    spec = _resolve_or_none(name)
     if not spec:
         raise KeyError(f"Unsupported license '{name}'. Use --list to see supported identifiers.")
     return spec
 
 
 def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Generate popular open source licenses from SPDX templates.",
     )
-    parser.add_argument("license", nargs="?", help="License identifier or alias (e.g. MIT, Apache-2.0)")
-    parser.add_argument("-o", "--output", help="Write the generated license to this path")
-    parser.add_argument("-f", "--force", action="store_true", help="Overwrite the output file if it exists")
-    parser.add_argument("--list", action="store_true", help="List supported licenses and exit")
-    parser.add_argument(
+    add = parser.add_argument
+    add("license", nargs="?", help="License identifier or alias (e.g. MIT, Apache-2.0)")
+    add("-o", "--output", help="Write the generated license to this path")
+    add("-f", "--force", action="store_true", help="Overwrite the output file if it exists")
+    add("--list", action="store_true", help="List supported licenses and exit")
+    add(
         "--defaults",
         action="store_true",
         help="Skip prompts by using default values wherever possible",
     )
-    parser.add_argument("--year", help="Override the copyright year")
-    parser.add_argument("--holder", help="Override the copyright holder/author")
-    parser.add_argument("--owner", help="Override owner fields (e.g. BSD)")
-    parser.add_argument("--email", help="Override contact email")
-    parser.add_argument("--program-name", help="Override the program name for GPL-style notices")
-    parser.add_argument("--program-description", help="Override the one-line description")
-    parser.add_argument("--program-url", help="Override the project URL")
-    parser.add_argument("--project-name", help="Override the project name used in preambles")
-    parser.add_argument(
+    add("--year", help="Override the copyright year")
+    add("--holder", help="Override the copyright holder/author")
+    add("--owner", help="Override owner fields (e.g. BSD)")
+    add("--email", help="Override contact email")
+    add("--program-name", help="Override the program name for GPL-style notices")
+    add("--program-description", help="Override the one-line description")
+    add("--program-url", help="Override the project URL")
+    add("--project-name", help="Override the project name used in preambles")
+    add(
         "--set",
         action="append",
         metavar="KEY=VALUE",
@@ -991,53 +464,89 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
     return parser.parse_args(argv)
 
 
+# Command-line option (argparse dest) -> context keys it fills, applied in order.
+CLI_OVERRIDE_KEYS: Sequence[Tuple[str, Tuple[str, ...]]] = (
+    ("year", ("year",)),
+    ("holder", ("copyright_holder", "owner")),
+    ("owner", ("owner",)),
+    ("email", ("email",)),
+    ("program_name", ("program_name",)),
+    ("program_description", ("program_description",)),
+    ("program_url", ("program_url",)),
+    ("project_name", ("project_name",)),
+)
+
+
+def parse_assignment(assignment: str) -> Tuple[str, str]:
+    """Split a ``KEY=VALUE`` override into its trimmed key and value."""
+    key, separator, value = assignment.partition("=")
+    if not separator:
+        raise ValueError(f"Invalid --set value '{assignment}'. Expected KEY=VALUE.")
+    key = key.strip()
+    if not key:
+        raise ValueError("Override key cannot be empty.")
+    return key, value.strip()
+
+
 def build_cli_overrides(args: argparse.Namespace) -> Context:
     overrides: Context = {}
-
-    def push(value: Optional[str], *keys: str) -> None:
+    options = vars(args)
+    for option, keys in CLI_OVERRIDE_KEYS:
+        value = options.get(option)
         if value is None:
-            return
+            continue
         trimmed = value.strip()
         if not trimmed:
-            return
+            continue
         for key in keys:
             overrides[key] = trimmed
 
-    push(args.year, "year")
-    push(args.holder, "copyright_holder", "owner")
-    push(args.owner, "owner")
-    push(args.email, "email")
-    push(args.program_name, "program_name")
-    push(args.program_description, "program_description")
-    push(args.program_url, "program_url")
-    push(args.project_name, "project_name")
-
-    for assignment in getattr(args, "set", []) or []:
-        if "=" not in assignment:
-            raise ValueError(f"Invalid --set value '{assignment}'. Expected KEY=VALUE.")
-        key, value = assignment.split("=", 1)
-        key = key.strip()
-        if not key:
-            raise ValueError("Override key cannot be empty.")
-        overrides[key] = value.strip()
+    for assignment in args.set:
+        key, value = parse_assignment(assignment)
+        overrides[key] = value
 
     return overrides
 
 
+def write_stdout(segments: Sequence[str]) -> None:
+    stream = sys.stdout
+    buffer = getattr(stream, "buffer", None)
+    # Piped output on POSIX is encoded once and handed straight to the byte buffer;
+    # terminals, stream replacements and platforms with newline translation keep the text layer.
+    if buffer is None or os.linesep != "\n" or stream.isatty():
+        stream.writelines(segments)
+        return
+    stream.flush()
+    buffer.write("".join(segments).encode(stream.encoding or "utf-8", stream.errors or "strict"))
+
+
+@functools.lru_cache(maxsize=1)
+def _stdin_is_tty() -> bool:
+    return sys.stdin.isatty()
+
+
 def main(argv: Optional[Sequence[str]] = None) -> int:
-    args = parse_args(argv)
+    arguments = list(sys.argv[1:] if argv is None else argv)
+    # Answer the trivial invocations before building the argument parser.
+    if not arguments:
+        print(NO_LICENSE_MESSAGE, file=sys.stderr)
+        return 1
+    if arguments == ["--list"]:
+        display_license_list(_spec_table().LICENSE_SPECS)
+        return 0
+    args = parse_args(arguments)
     if args.list:
-        display_license_list(LICENSE_SPECS)
+        display_license_list(_spec_table().LICENSE_SPECS)
         return 0
     if not args.license:
-        print("No license specified. Use --list to see available options.", file=sys.stderr)
+        print(NO_LICENSE_MESSAGE, file=sys.stderr)
         return 1
     try:
         spec = resolve_spec(args.license)
     except KeyError as exc:
         print(str(exc), file=sys.stderr)
         return 1
-    skip_prompts = bool(args.defaults or not sys.stdin.isatty())
+    skip_prompts = bool(args.defaults or not _stdin_is_tty())
     try:
         overrides = build_cli_overrides(args)
     except ValueError as exc:
@@ -1049,18 +558,24 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         print(str(exc), file=sys.stderr)
         return 1
     try:
-        output_text = render_license(spec, context)
+        segments = render_license_segments(spec, context)
     except Exception as exc:  # pragma: no cover - surfaced to end user
         print(f"Failed to render license: {exc}", file=sys.stderr)
         return 1
     if args.output:
         path = Path(args.output).expanduser()
-        if path.exists() and not args.force:
+        # O_EXCL makes the existence check and the create a single atomic step.
+        flags = os.O_WRONLY | os.O_CREAT | getattr(os, "O_BINARY", 0)
+        flags |= os.O_TRUNC if args.force else os.O_EXCL
+        try:
+            fd = os.open(path, flags, 0o666)
+        except FileExistsError:
             print(f"Refusing to overwrite existing file: {path}. Use --force to override.", file=sys.stderr)
             return 1
-        path.write_text(output_text, encoding="utf-8")
+        with open(fd, "w", encoding="utf-8") as handle:
+            handle.writelines(segments)
     else:
-        sys.stdout.write(output_text)
+        write_stdout(segments)
     return 0
 
 